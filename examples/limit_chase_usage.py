@@ -9,26 +9,35 @@ Stops after the first fill or after an abort (price moved beyond max chase).
 """
 
 import asyncio
-import os
+import logging
+import queue
 
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # Optional: faster event loop (not available on Windows)
+    uvloop = None
+
 # Add parent directory to path to import package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from hl_limit_chase import (
     HyperliquidExecutor,
     AccountNotInitializedError,
+    env_flag,
     get_ws_uri,
     LiveExchangeClient,
     LimitChaser,
+    QuoteSlot,
     stream_l2_to_queue,
 )
 
 # ----- Configuration -----
-TESTNET = str(os.getenv("TESTNET", "false")).lower() in ("true", "1", "yes")
-POST_ONLY = str(os.getenv("POST_ONLY", "true")).lower() in ("true", "1", "yes")
+TESTNET = env_flag("TESTNET")
+POST_ONLY = env_flag("POST_ONLY", default=True)
 
 COIN = "BTC"
 TICK_SIZE = 0.5
@@ -40,6 +49,16 @@ SIDE = "buy"
 ORDER_SIZE = 0.0002
 
 
+def _start_log_listener() -> QueueListener:
+    """Send log records through a queue so stdout writes happen off the event loop."""
+    log_queue: queue.Queue = queue.Queue(-1)
+    logging.getLogger().addHandler(QueueHandler(log_queue))
+    logging.getLogger("hl_limit_chase.limit_chase").setLevel(logging.INFO)
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
+
+
 async def run() -> str:
     """
     Chase until one bid is filled (or we abort). Returns "filled" or "aborted".
@@ -66,17 +85,14 @@ async def run() -> str:
         max_chase_ticks=MAX_CHASE_TICKS,
     )
 
-    q: asyncio.Queue = asyncio.Queue(maxsize=1000)
+    q = QuoteSlot(min_interval_ms=REFRESH_INTERVAL_MS)
     stream_task = asyncio.create_task(stream_l2_to_queue(q, COIN, uri))
-    last_check = 0
+    # Fills are pushed over the WebSocket; poll_fill only hits HTTP when it is down
+    fills_task = asyncio.create_task(ex.stream_order_updates(uri))
 
     async def consumer() -> str:
-        nonlocal last_check
         while True:
             quote = await q.get()
-            now = quote.ts_ms
-            if now - last_check < REFRESH_INTERVAL_MS:
-                continue
             try:
                 out = await chaser.on_quote(quote)
             except AccountNotInitializedError:
@@ -89,7 +105,6 @@ async def run() -> str:
                 )
                 print("=" * 60)
                 raise
-            last_check = now
             if out in ("filled", "aborted"):
                 stream_task.cancel()
                 return out
@@ -97,19 +112,27 @@ async def run() -> str:
     try:
         res = await consumer()
     finally:
+        fills_task.cancel()
+        # A failed fill stream only meant falling back to HTTP polling
+        await asyncio.gather(fills_task, return_exceptions=True)
         try:
             await stream_task
         except asyncio.CancelledError:
             pass
+        ex.close()
+        executor.close()
 
     return res
 
 
 if __name__ == "__main__":
+    log_listener = _start_log_listener()
     try:
-        res = asyncio.run(run())
+        res = uvloop.run(run()) if uvloop else asyncio.run(run())
         print("\nDone: %s" % res)
     except AccountNotInitializedError:
         pass
     except KeyboardInterrupt:
         print("\nInterrupted.")
+    finally:
+        log_listener.stop()
@@ -13,28 +13,38 @@ Run:
 
 import asyncio
 import csv
+import logging
 import os
+import queue
 from datetime import datetime, timezone
 from typing import Optional
 
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # Optional: faster event loop (not available on Windows)
+    uvloop = None
+
 # Add parent directory to path to import package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from hl_limit_chase import (
     HyperliquidExecutor,
     AccountNotInitializedError,
+    env_flag,
     get_ws_uri,
     LiveExchangeClient,
     LimitChaser,
+    QuoteSlot,
     stream_l2_to_queue,
 )
 
 # ----- Config -----
-TESTNET = str(os.getenv("TESTNET", "false")).lower() in ("true", "1", "yes")
-POST_ONLY = str(os.getenv("POST_ONLY", "true")).lower() in ("true", "1", "yes")
+TESTNET = env_flag("TESTNET")
+POST_ONLY = env_flag("POST_ONLY", default=True)
 
 COIN = "BTC"
 ORDER_SIZE = 0.0002  # 0.0002 BTC (real money when TESTNET=false)
@@ -86,16 +96,22 @@ class CountingLiveExchangeClient:
 # ----- CSV helpers -----
 
 
-def _ensure_csv_header() -> None:
-    if not os.path.exists(_CSV_PATH):
-        with open(_CSV_PATH, "w", newline="") as f:
-            csv.DictWriter(f, fieldnames=_CSV_FIELDS).writeheader()
-        return
-    with open(_CSV_PATH, "r", newline="") as f:
-        first = f.readline()
-    if "timestamp" not in first:
-        with open(_CSV_PATH, "w", newline="") as f:
-            csv.DictWriter(f, fieldnames=_CSV_FIELDS).writeheader()
+_csv_writer: Optional[csv.DictWriter] = None
+
+
+def _get_writer() -> csv.DictWriter:
+    """Open the stats CSV once per process (line-buffered), writing the header if missing."""
+    global _csv_writer
+    if _csv_writer is None:
+        need_header = True
+        if os.path.exists(_CSV_PATH):
+            with open(_CSV_PATH, "r", newline="") as f:
+                need_header = "timestamp" not in f.readline()
+        f = open(_CSV_PATH, "w" if need_header else "a", newline="", buffering=1)
+        _csv_writer = csv.DictWriter(f, fieldnames=_CSV_FIELDS)
+        if need_header:
+            _csv_writer.writeheader()
+    return _csv_writer
 
 
 def _append_stats(
@@ -121,14 +137,22 @@ def _append_stats(
         "tolerance_ticks": tolerance_ticks, "max_age_ms": max_age_ms,
         "max_chase_ticks": max_chase_ticks, "test_name": test_name,
     }
-    _ensure_csv_header()
-    with open(_CSV_PATH, "a", newline="") as f:
-        csv.DictWriter(f, fieldnames=_CSV_FIELDS).writerow(row)
+    _get_writer().writerow(row)
 
 
 # ----- Main -----
 
 
+def _start_log_listener() -> QueueListener:
+    """Send log records through a queue so stdout writes happen off the event loop."""
+    log_queue: queue.Queue = queue.Queue(-1)
+    logging.getLogger().addHandler(QueueHandler(log_queue))
+    logging.getLogger("hl_limit_chase.limit_chase").setLevel(logging.INFO)
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
+
+
 async def run() -> str:
     uri = get_ws_uri(TESTNET)
     network = "TESTNET (test funds)" if TESTNET else "MAINNET (REAL MONEY)"
@@ -160,18 +184,17 @@ async def run() -> str:
         max_chase_ticks=MAX_CHASE_TICKS,
     )
 
-    q: asyncio.Queue = asyncio.Queue(maxsize=1000)
+    q = QuoteSlot(min_interval_ms=REFRESH_INTERVAL_MS)
     stream_task = asyncio.create_task(stream_l2_to_queue(q, COIN, uri))
-    last_check = 0
+    # Fills are pushed over the WebSocket; poll_fill only hits HTTP when it is down
+    fills_task = asyncio.create_task(ex.stream_order_updates(uri))
     first_ts: Optional[int] = None
 
     async def consumer() -> str:
-        nonlocal last_check, first_ts
+        nonlocal first_ts
         while True:
             quote = await q.get()
             now = quote.ts_ms
-            if now - last_check < REFRESH_INTERVAL_MS:
-                continue
             if first_ts is None:
                 first_ts = now
             try:
@@ -182,7 +205,6 @@ async def run() -> str:
                 print("Do one trade in the Hyperliquid UI (testnet or mainnet) with this wallet, then retry.")
                 print("=" * 60)
                 raise
-            last_check = now
             if out in ("filled", "aborted"):
                 duration_ms = now - (first_ts or now)
                 _append_stats(
@@ -206,19 +228,27 @@ async def run() -> str:
     try:
         res = await consumer()
     finally:
+        fills_task.cancel()
+        # A failed fill stream only meant falling back to HTTP polling
+        await asyncio.gather(fills_task, return_exceptions=True)
         try:
             await stream_task
         except asyncio.CancelledError:
             pass
+        ex.close()
+        executor.close()
 
     return res
 
 
 if __name__ == "__main__":
+    log_listener = _start_log_listener()
     try:
-        res = asyncio.run(run())
+        res = uvloop.run(run()) if uvloop else asyncio.run(run())
         print("Done: %s" % res)
     except AccountNotInitializedError:
         pass
     except KeyboardInterrupt:
         print("\nInterrupted.")
+    finally:
+        log_listener.stop()
@@ -8,20 +8,24 @@ from .limit_chase import (
     LimitChaser,
     LiveExchangeClient,
     Quote,
+    QuoteSlot,
     get_ws_uri,
     stream_l2_to_queue,
 )
-from .executor import HyperliquidExecutor, AccountNotInitializedError
+from .executor import HyperliquidExecutor, AccountNotInitializedError, TRUTHY, env_flag
 from .trade_logger import TradeLogger
 
 __all__ = [
     "LimitChaser",
     "LiveExchangeClient",
     "Quote",
+    "QuoteSlot",
     "get_ws_uri",
     "stream_l2_to_queue",
     "HyperliquidExecutor",
     "AccountNotInitializedError",
+    "TRUTHY",
+    "env_flag",
     "TradeLogger",
 ]
 
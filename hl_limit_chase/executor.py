@@ -1,8 +1,13 @@
 from hyperliquid.exchange import Exchange
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
 import math
 import os
+from functools import lru_cache
+from operator import itemgetter
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging 
 from typing import Dict, Any
 from .trade_logger import TradeLogger
@@ -11,101 +16,316 @@ from datetime import datetime, timezone
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Snapshot of the environment taken once at import (after .env is loaded),
+# so constructors don't hit os.environ on every call.
+# Boolean flags such as TESTNET are read through env_flag instead.
+_ENV_KEYS = (
+    "PK",
+    "ADDRESS",
+    "DATABASE_URL",
+)
+_ENV = {k: os.environ.get(k) for k in _ENV_KEYS}
+
+# Field accessors for order responses and fill details
+_get_status = itemgetter('status', 'response')
+_get_fill = itemgetter('totalSz', 'avgPx', 'oid')
+
+_LOG10_2 = math.log10(2)
+
+# Hyperliquid perp prices may have at most MAX_DECIMALS - szDecimals decimals.
+_PERP_MAX_DECIMALS = 6
+# Spot assets are numbered from 10000 and use a different decimals limit.
+_SPOT_ASSET_OFFSET = 10000
+
+# Accepted spellings of "true" for boolean env flags (compared lowercased)
+TRUTHY = frozenset({"true", "1", "yes", "on", "y", "t"})
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """Read a boolean env flag; any value in TRUTHY is true, unset means `default`."""
+    value = os.environ.get(name)
+    return default if value is None else value.strip().lower() in TRUTHY
+
+
+_TESTNET = env_flag("TESTNET")
+
 
 class AccountNotInitializedError(Exception):
     """Raised when the account is not initialized on the network (fix: do one trade in the UI)."""
 
 
+@lru_cache(maxsize=4096)
 def _round_limit_price_for_hyperliquid(price: float) -> float:
     """
     Round limit price to Hyperliquid's rule: max 5 significant figures.
     Prevents 'Price must be divisible by tick size' / tick-size violations.
+
+    Memoized: a chase re-submits the same few prices many times.
+    Use _round_limit_price_for_hyperliquid.cache_clear() to reset.
     """
     if price == 0:
         return 0.0
+    # Fast path for prices already at <= 5 significant figures. frexp's binary
+    # exponent gives a lower bound on the allowed decimals without calling
+    # log10, so an exact integer after scaling means no rounding is needed.
+    _, exp = math.frexp(price)
+    k = 4 - math.floor(exp * _LOG10_2)
+    if k >= 0:
+        scale = 10 ** k
+        scaled = price * scale
+        units = round(scaled)
+        if scaled == units:
+            return units / scale
+    else:
+        scale = 10 ** -k
+        scaled = price / scale
+        units = round(scaled)
+        if scaled == units:
+            return float(units * scale)
     n = 5
     ndigits = -int(math.floor(math.log10(abs(price)))) + (n - 1)
     return round(price, ndigits)
 
+
+def _parse_order_status(order_result: Dict[str, Any] | None, index: int = 0) -> tuple[str, Any] | None:
+    """
+    Classify an order/market_open/bulk_orders response.
+
+    Args:
+        index (int): Which order status to read (bulk_orders returns one per order).
+
+    Returns:
+        ('err', msg) for an explicit API error, ('filled', info) or ('resting', info)
+        for the order status at `index`, or None if the response has an unexpected shape.
+    """
+    try:
+        if order_result.get('status') == 'err':
+            return 'err', order_result.get('response', str(order_result))
+        result_status, response = _get_status(order_result)
+        if result_status != 'ok':
+            return None
+        status = response['data']['statuses'][index]
+    except (AttributeError, KeyError, TypeError, IndexError):
+        return None
+    if 'filled' in status:
+        return 'filled', status['filled']
+    if 'resting' in status:
+        return 'resting', status['resting']
+    return None
+
+
+def _mount_keepalive_adapter(session) -> None:
+    """
+    Mount a pooled keep-alive adapter on an SDK requests.Session.
+
+    Only connection errors are retried: the request never reached the server,
+    so this cannot duplicate an order.
+    """
+    retry = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.1)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _positions_by_coin(positions: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Index a user_state response's assetPositions by coin symbol."""
+    return {p['position']['coin']: p for p in positions.get('assetPositions', [])}
+
 class HyperliquidExecutor:
-    def __init__(self, testnet: bool = False):
+    __slots__ = ('is_testnet', 'pk', 'address', 'wallet', 'exchange', '_trade_logger', '_db_url', '_sz_decimals')
+
+    # (address, is_testnet) pairs known to exist in this process, either from
+    # _validate_account or from an order the exchange accepted
+    _validated: set[tuple[str, bool]] = set()
+
+    def __init__(self, testnet: bool | None = None, wallet: LocalAccount | None = None,
+                 trade_logger: TradeLogger | None = None):
         """Initialize the Hyperliquid trading executor
         
         Args:
-            testnet (bool)
+            testnet (bool, optional): Defaults to the TESTNET env flag.
+            wallet (LocalAccount, optional): Pre-built signing wallet. When given,
+                PK is not re-derived with Account.from_key.
+            trade_logger (TradeLogger, optional): Logger to use instead of one built
+                from DATABASE_URL on first use.
         """
-        self.is_testnet = testnet
+        self.is_testnet = _TESTNET if testnet is None else testnet
         network_msg = "TESTNET" if self.is_testnet else "MAINNET"
-        logger.info(f"Initializing HyperliquidExecutor for {network_msg}")
+        logger.info("Initializing HyperliquidExecutor for %s", network_msg)
 
         # Get credentials from .env (Privat Key and Public Address (ETH))
-        self.pk = os.getenv("PK")
-        self.address = os.getenv("ADDRESS")
+        self.pk = _ENV["PK"]
+        self.address = _ENV["ADDRESS"]
         
-        if not self.pk or not self.address:
+        if (wallet is None and not self.pk) or not self.address:
             logger.error("FATAL: Missing PK or ADDRESS in .env file.")
             raise ValueError("Missing PK or ADDRESS in .env")
             
         # Create wallet and initialize exchange
-        self.wallet = Account.from_key(self.pk)
+        self.wallet = wallet if wallet is not None else Account.from_key(self.pk)
         self.exchange = Exchange(
             wallet=self.wallet,
             base_url="https://api.hyperliquid-testnet.xyz" if self.is_testnet else None
         )
+        # Reuse TCP/TLS connections for order and info requests
+        for api in (self.exchange, self.exchange.info):
+            session = getattr(api, "session", None)
+            if session is not None:
+                _mount_keepalive_adapter(session)
+        # perp symbol -> szDecimals, filled lazily (see _load_sz_decimals)
+        self._sz_decimals: Dict[str, int] = {}
         
-        # Add account validation step
-        if not self._validate_account():
-            logger.error(f"FATAL: Account {self.address} does not seem to exist on {network_msg}. "
-                         f"Please check your .env credentials and the 'testnet' flag.")
+        # Add account validation step (once per address/network per process)
+        validation_key = (self.address, self.is_testnet)
+        if validation_key in HyperliquidExecutor._validated:
+            logger.debug("Account %s already validated on %s, skipping.", self.address, network_msg)
+        elif self._validate_account():
+            HyperliquidExecutor._validated.add(validation_key)
+        else:
+            logger.error("FATAL: Account %s does not seem to exist on %s. "
+                         "Please check your .env credentials and the 'testnet' flag.",
+                         self.address, network_msg)
             raise ValueError(f"Account {self.address} not found on {network_msg}")
 
-        # Initialize trade logger
+        # Trade logger is created on first use (see trade_logger property)
         # DATABASE_URL should be set in .env file - never hardcode credentials!
-        db_url = os.getenv("DATABASE_URL")
-        if db_url:
-            self.trade_logger = TradeLogger(db_url)
-        else:
-            # If no DATABASE_URL provided, use a no-op logger
-            self.trade_logger = TradeLogger("")  # Empty string will use console logging only
+        # If no DATABASE_URL provided, an empty string will use console logging only
+        self._db_url = _ENV["DATABASE_URL"] or ""
+        self._trade_logger = trade_logger
         
-        logger.info(f"Successfully initialized HyperliquidExecutor for address: {self.address} on {network_msg}")
+        logger.info("Successfully initialized HyperliquidExecutor for address: %s on %s", self.address, network_msg)
+
+    @property
+    def trade_logger(self) -> TradeLogger:
+        """Trade logger, built from DATABASE_URL the first time a trade is logged."""
+        if self._trade_logger is None:
+            self._trade_logger = TradeLogger(self._db_url)
+        return self._trade_logger
+
+    def close(self) -> None:
+        """Flush and close the trade logger, if one was created."""
+        if self._trade_logger is not None:
+            self._trade_logger.close()
+
+    @classmethod
+    def from_env(cls, testnet: bool | None = None) -> "HyperliquidExecutor":
+        """
+        Build an executor from .env, deriving the wallet from PK exactly once.
+
+        Args:
+            testnet (bool, optional): Defaults to the TESTNET env flag.
+        """
+        if not _ENV["PK"]:
+            logger.error("FATAL: Missing PK or ADDRESS in .env file.")
+            raise ValueError("Missing PK or ADDRESS in .env")
+        wallet = Account.from_key(_ENV["PK"])
+        return cls(testnet=testnet, wallet=wallet)
+
+    @classmethod
+    def invalidate_validation(cls) -> None:
+        """Forget cached account validations so the next instance re-checks."""
+        cls._validated.clear()
+
+    def _mark_account_known_good(self) -> None:
+        """Record that the exchange accepted an order for this account."""
+        HyperliquidExecutor._validated.add((self.address, self.is_testnet))
+
+    def _raise_if_not_initialized(self, err_msg: Any) -> None:
+        """Raise AccountNotInitializedError if the API error says the account does not exist."""
+        if "does not exist" in str(err_msg):
+            net = "TESTNET" if self.is_testnet else "MAINNET"
+            logger.error(
+                "Account not initialized on %s. Fix: open Hyperliquid %s app, "
+                "connect wallet %s, do one trade (or use faucet), then retry.",
+                net, net.lower(), self.address,
+            )
+            raise AccountNotInitializedError(
+                f"Account {self.address} not initialized on {net}. Do one trade in the UI first."
+            )
 
     def _validate_account(self) -> bool:
         """Verify that the user account exists on the selected network."""
         try:
-            logger.info(f"Validating account {self.address}...")
+            logger.info("Validating account %s...", self.address)
             state = self.exchange.info.user_state(self.address)
             if state and 'assetPositions' in state:
                 logger.info("Account validation successful.")
                 return True
-            logger.warning(f"Account validation failed: Unexpected response format: {state}")
+            logger.warning("Account validation failed: Unexpected response format: %s", state)
             return False
         except Exception as e:
             # The API might raise an exception for non-existent users, check the error message
             if "User not found" in str(e) or "does not exist" in str(e):
-                logger.error(f"Account validation failed for {self.address}: User not found on the network.")
+                logger.error("Account validation failed for %s: User not found on the network.", self.address)
                 return False
-            logger.error(f"An unexpected error occurred during account validation: {e}", exc_info=True)
+            logger.error("An unexpected error occurred during account validation: %s", e, exc_info=True)
             return False
 
+    def _load_sz_decimals(self) -> Dict[str, int]:
+        """
+        Build the perp symbol -> szDecimals map.
+
+        The SDK's Info already resolved these from meta() when the Exchange was
+        created, so reuse its maps and only fall back to a fresh meta() call for
+        SDK versions that don't expose them.
+        """
+        info = self.exchange.info
+        try:
+            return {
+                name: info.asset_to_sz_decimals[asset]
+                for name, coin in info.name_to_coin.items()
+                if (asset := info.coin_to_asset[coin]) < _SPOT_ASSET_OFFSET
+            }
+        except (AttributeError, KeyError):
+            meta = info.meta()
+            return {asset['name']: asset['szDecimals'] for asset in meta['universe']}
+
+    def _get_price_decimals(self, symbol: str) -> int | None:
+        """
+        Max price decimals allowed for `symbol` (MAX_DECIMALS - szDecimals).
+
+        The szDecimals map is loaded once and cached for all symbols.
+        Returns None if the metadata is unavailable or the symbol is unknown.
+        """
+        if not self._sz_decimals:
+            try:
+                self._sz_decimals = self._load_sz_decimals()
+            except Exception as e:
+                logger.warning("Could not fetch asset metadata: %s", e)
+                return None
+        sz_decimals = self._sz_decimals.get(symbol)
+        if sz_decimals is None:
+            return None
+        return max(_PERP_MAX_DECIMALS - sz_decimals, 0)
+
+    def _round_price(self, symbol: str, price: float) -> float:
+        """Round a price to 5 significant figures and the asset's max decimals."""
+        px = _round_limit_price_for_hyperliquid(price)
+        price_decimals = self._get_price_decimals(symbol)
+        if price_decimals is not None:
+            px = round(px, price_decimals)
+        return px
+
     def get_positions(self) -> Dict[str, Any]:
         """Get current positions"""
         try:
             positions = self.exchange.info.user_state(self.address)
-            logger.debug(f"Fetched positions for {self.address}: {positions}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Fetched positions for %s: %s", self.address, positions)
             return positions
         except Exception as e:
-            logger.error(f"Error fetching positions: {e}", exc_info=True)
+            logger.error("Error fetching positions: %s", e, exc_info=True)
             return {}
 
     def get_markets(self) -> Dict[str, Any]:
         """Get available markets and prices"""
         try:
             markets = self.exchange.info.all_mids()
-            logger.debug(f"Fetched markets: {markets}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Fetched markets: %s", markets)
             return markets
         except Exception as e:
-            logger.error(f"Error fetching markets: {e}", exc_info=True)
+            logger.error("Error fetching markets: %s", e, exc_info=True)
             return {}
 
     def execute_market_order(self, symbol: str, is_buy: bool, size_in_asset: float, 
@@ -124,7 +344,9 @@ class HyperliquidExecutor:
             bool: True if the order was executed successfully, False otherwise.
         """
         action = "buy" if is_buy else "sell"
-        logger.info(f"Attempting to place market {action} order for {size_in_asset:.6f} {symbol}.")
+        # Log the trade if it's an entry (buy order) with signal context
+        log_entry = is_buy and zscore is not None and trend is not None
+        logger.info("Attempting to place market %s order for %.6f %s.", action, size_in_asset, symbol)
         try:
             order_result = self.exchange.market_open(
                 name=symbol,
@@ -133,58 +355,43 @@ class HyperliquidExecutor:
                 slippage=0.01  # Allow 1% slippage
             )
             
-            logger.info(f"Market {action} order response: {order_result}")
+            logger.info("Market %s order response: %s", action, order_result)
             
+            kind, info = _parse_order_status(order_result) or (None, None)
+            if kind in ('filled', 'resting'):
+                self._mark_account_known_good()
+
             # Handle explicit API errors (e.g. "User or API Wallet ... does not exist")
-            if order_result and order_result.get('status') == 'err':
-                err_msg = order_result.get('response', str(order_result))
-                logger.error(f"Market {action} order failed: {err_msg}")
-                if "does not exist" in str(err_msg):
-                    net = "TESTNET" if self.is_testnet else "MAINNET"
-                    logger.error(
-                        f"Account not initialized on {net}. Fix: open Hyperliquid {net.lower()} app, "
-                        f"connect wallet %s, do one trade (or use faucet), then retry.",
-                        self.address,
-                    )
-                    raise AccountNotInitializedError(
-                        f"Account {self.address} not initialized on {net}. Do one trade in the UI first."
-                    )
+            if kind == 'err':
+                logger.error("Market %s order failed: %s", action, info)
+                self._raise_if_not_initialized(info)
                 return False
             
-            # Check the correct response structure
-            if (order_result and 
-                order_result.get('status') == 'ok' and 
-                'response' in order_result and 
-                'data' in order_result['response'] and 
-                'statuses' in order_result['response']['data']):
+            if kind == 'filled':
+                sz, px, oid = _get_fill(info)
+                logger.info("Successfully placed market %s order for %s.", action, symbol)
+                logger.info("Fill details - Size: %s, Price: %s, Order ID: %s", sz, px, oid)
+                
+                if log_entry:
+                    self.trade_logger.log_entry_trade(
+                        symbol=symbol,
+                        size=float(sz),
+                        price=float(px),
+                        zscore=zscore,
+                        trend=trend,
+                        order_id=str(oid)
+                    )
                 
-                status = order_result['response']['data']['statuses'][0]
-                if 'filled' in status:
-                    filled_info = status['filled']
-                    logger.info(f"Successfully placed market {action} order for {symbol}.")
-                    logger.info(f"Fill details - Size: {filled_info['totalSz']}, Price: {filled_info['avgPx']}, Order ID: {filled_info['oid']}")
-                    
-                    # Log the trade if it's an entry (buy order)
-                    if is_buy and zscore is not None and trend is not None:
-                        self.trade_logger.log_entry_trade(
-                            symbol=symbol,
-                            size=float(filled_info['totalSz']),
-                            price=float(filled_info['avgPx']),
-                            zscore=zscore,
-                            trend=trend,
-                            order_id=str(filled_info['oid'])
-                        )
-                    
-                    return True
-                elif 'resting' in status:
-                    logger.info(f"Order is resting (not yet filled) for {symbol}.")
-                    return True
+                return True
+            elif kind == 'resting':
+                logger.info("Order is resting (not yet filled) for %s.", symbol)
+                return True
             
-            logger.warning(f"Market {action} order for {symbol} may not have been successful. Response: {order_result}")
+            logger.warning("Market %s order for %s may not have been successful. Response: %s", action, symbol, order_result)
             return False
             
         except Exception as e:
-            logger.error(f"Error executing market {action} order for {symbol}: {e}", exc_info=True)
+            logger.error("Error executing market %s order for %s: %s", action, symbol, e, exc_info=True)
             return False
 
     def execute_limit_order(self, symbol: str, is_buy: bool, size_in_asset: float, 
@@ -204,10 +411,12 @@ class HyperliquidExecutor:
             int | None: Order ID (oid) if placed or filled successfully, None otherwise.
         """
         action = "buy" if is_buy else "sell"
-        limit_px = _round_limit_price_for_hyperliquid(limit_price)
+        # Log the trade if it's an entry (buy order) with signal context
+        log_entry = is_buy and zscore is not None and trend is not None
+        limit_px = self._round_price(symbol, limit_price)
         if limit_px != limit_price:
-            logger.debug(f"Limit price rounded for Hyperliquid: {limit_price} -> {limit_px}")
-        logger.info(f"Attempting to place limit {action} order for {size_in_asset:.6f} {symbol} at ${limit_px:.4f}.")
+            logger.debug("Limit price rounded for Hyperliquid: %s -> %s", limit_price, limit_px)
+        logger.info("Attempting to place limit %s order for %.6f %s at $%.4f.", action, size_in_asset, symbol, limit_px)
         try:
             order_result = self.exchange.order(
                 name=symbol,
@@ -217,64 +426,48 @@ class HyperliquidExecutor:
                 order_type={"limit": {"tif": "Gtc"}}  # Good till cancelled
             )
             
-            logger.info(f"Limit {action} order response: {order_result}")
+            logger.info("Limit %s order response: %s", action, order_result)
             
+            kind, info = _parse_order_status(order_result) or (None, None)
+            if kind in ('filled', 'resting'):
+                self._mark_account_known_good()
+
             # Handle explicit API errors (e.g. "User or API Wallet ... does not exist")
-            if order_result and order_result.get('status') == 'err':
-                err_msg = order_result.get('response', str(order_result))
-                logger.error(f"Limit {action} order failed: {err_msg}")
-                if "does not exist" in str(err_msg):
-                    net = "TESTNET" if self.is_testnet else "MAINNET"
-                    logger.error(
-                        f"Account not initialized on {net}. Fix: open Hyperliquid {net.lower()} app, "
-                        f"connect wallet %s, do one trade (or use faucet), then retry.",
-                        self.address,
-                    )
-                    raise AccountNotInitializedError(
-                        f"Account {self.address} not initialized on {net}. Do one trade in the UI first."
-                    )
+            if kind == 'err':
+                logger.error("Limit %s order failed: %s", action, info)
+                self._raise_if_not_initialized(info)
                 return None
             
-            # Check the correct response structure
-            if (order_result and 
-                order_result.get('status') == 'ok' and 
-                'response' in order_result and 
-                'data' in order_result['response'] and 
-                'statuses' in order_result['response']['data']):
+            if kind == 'filled':
+                sz, px, oid = _get_fill(info)
+                logger.info("Successfully filled limit %s order for %s.", action, symbol)
+                logger.info("Fill details - Size: %s, Price: %s, Order ID: %s", sz, px, oid)
                 
-                status = order_result['response']['data']['statuses'][0]
-                if 'filled' in status:
-                    filled_info = status['filled']
-                    oid = filled_info.get('oid')
-                    logger.info(f"Successfully filled limit {action} order for {symbol}.")
-                    logger.info(f"Fill details - Size: {filled_info['totalSz']}, Price: {filled_info['avgPx']}, Order ID: {oid}")
-                    
-                    # Log the trade if it's an entry (buy order)
-                    if is_buy and zscore is not None and trend is not None:
-                        self.trade_logger.log_entry_trade(
-                            symbol=symbol,
-                            size=float(filled_info['totalSz']),
-                            price=float(filled_info['avgPx']),
-                            zscore=zscore,
-                            trend=trend,
-                            order_id=str(oid)
-                        )
-                    
-                    return int(oid) if oid is not None else None
-                elif 'resting' in status:
-                    resting_info = status['resting']
-                    oid = resting_info.get('oid') or resting_info.get('orderId')
-                    logger.info(f"Limit {action} order placed and resting for {symbol}.")
-                    logger.info(f"Resting order info: {resting_info}")
-                    size = resting_info.get('sz', resting_info.get('size', 'Unknown'))
-                    price = resting_info.get('px', resting_info.get('price', 'Unknown'))
-                    logger.info(f"Order details - Size: {size}, Price: {price}, Order ID: {oid}")
-                    return int(oid) if oid is not None else None
-            logger.warning(f"Limit {action} order for {symbol} may not have been successful. Response: {order_result}")
+                if log_entry:
+                    self.trade_logger.log_entry_trade(
+                        symbol=symbol,
+                        size=float(sz),
+                        price=float(px),
+                        zscore=zscore,
+                        trend=trend,
+                        order_id=str(oid)
+                    )
+                
+                return int(oid) if oid is not None else None
+            elif kind == 'resting':
+                resting_info = info
+                oid = resting_info.get('oid') or resting_info.get('orderId')
+                logger.info("Limit %s order placed and resting for %s.", action, symbol)
+                logger.info("Resting order info: %s", resting_info)
+                size = resting_info.get('sz', resting_info.get('size', 'Unknown'))
+                price = resting_info.get('px', resting_info.get('price', 'Unknown'))
+                logger.info("Order details - Size: %s, Price: %s, Order ID: %s", size, price, oid)
+                return int(oid) if oid is not None else None
+            logger.warning("Limit %s order for %s may not have been successful. Response: %s", action, symbol, order_result)
             return None
             
         except Exception as e:
-            logger.error(f"Error executing limit {action} order for {symbol}: {e}", exc_info=True)
+            logger.error("Error executing limit %s order for %s: %s", action, symbol, e, exc_info=True)
             return None
 
     def cancel_order(self, symbol: str, order_id: int) -> bool:
@@ -288,17 +481,17 @@ class HyperliquidExecutor:
         Returns:
             bool: True if the cancel request was successful, False otherwise.
         """
-        logger.info(f"Attempting to cancel order {order_id} for {symbol}.")
+        logger.info("Attempting to cancel order %s for %s.", order_id, symbol)
         try:
             cancel_result = self.exchange.cancel(symbol, order_id)
-            logger.info(f"Cancel order response: {cancel_result}")
+            logger.info("Cancel order response: %s", cancel_result)
             if cancel_result.get("status") == "ok":
-                logger.info(f"Successfully sent cancel request for order {order_id}.")
+                logger.info("Successfully sent cancel request for order %s.", order_id)
                 return True
-            logger.warning(f"Failed to cancel order {order_id}. Response: {cancel_result}")
+            logger.warning("Failed to cancel order %s. Response: %s", order_id, cancel_result)
             return False
         except Exception as e:
-            logger.error(f"Error canceling order {order_id} for {symbol}: {e}", exc_info=True)
+            logger.error("Error canceling order %s for %s: %s", order_id, symbol, e, exc_info=True)
             return False
 
     def get_order_status(self, order_id: int) -> Dict[str, Any] | None:
@@ -313,10 +506,11 @@ class HyperliquidExecutor:
         """
         try:
             status = self.exchange.info.query_order_by_oid(self.address, order_id)
-            logger.debug(f"Status for order {order_id}: {status}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Status for order %s: %s", order_id, status)
             return status
         except Exception as e:
-            logger.warning(f"Could not fetch status for order {order_id}: {e}")
+            logger.warning("Could not fetch status for order %s: %s", order_id, e)
             return None
 
     def close_position(self, symbol: str, entry_price: float = None, entry_time: datetime = None) -> bool:
@@ -331,92 +525,142 @@ class HyperliquidExecutor:
         Returns:
             bool: True if the position was closed successfully, False otherwise.
         """
-        logger.info(f"Attempting to close position for {symbol}.")
+        logger.info("Attempting to close position for %s.", symbol)
         try:
             # Get current position
             positions = self.get_positions()
-            position_found = False
-            position_size = 0.0
-            
-            # Find the position for the specified symbol
-            for pos in positions.get('assetPositions', []):
-                if pos['position']['coin'] == symbol:
-                    position_found = True
-                    position_size = abs(float(pos['position']['szi']))
-                    break
-            
-            if not position_found:
-                logger.warning(f"No open position found for {symbol}")
+            pos = _positions_by_coin(positions).get(symbol)
+            if pos is None:
+                logger.warning("No open position found for %s", symbol)
                 return False
-                
+            szi = float(pos['position']['szi'])
+        except Exception as e:
+            logger.error("Error closing position for %s: %s", symbol, e, exc_info=True)
+            return False
+
+        return self._close_position_by_size(symbol, abs(szi), entry_price, entry_time, is_buy=szi < 0)
+
+    def _close_position_by_size(self, symbol: str, size: float, entry_price: float = None,
+                                entry_time: datetime = None, is_buy: bool = False) -> bool:
+        """
+        Closes `size` of an open position for `symbol` with a market order.
+        is_buy is True when closing a short.
+
+        Returns:
+            bool: True if the position was closed successfully, False otherwise.
+        """
+        try:
             # Close the position using market_open with opposite direction
             order_result = self.exchange.market_open(
                 name=symbol,
-                is_buy=False,  # Sell to close
-                sz=position_size,
+                is_buy=is_buy,  # Opposite side of the position
+                sz=size,
                 slippage=0.01  # Allow 1% slippage
             )
             
-            logger.info(f"Close position order response: {order_result}")
-
-            # Check the correct response structure
-            if (order_result and 
-                order_result.get('status') == 'ok' and 
-                'response' in order_result and 
-                'data' in order_result['response'] and 
-                'statuses' in order_result['response']['data']):
+            logger.info("Close position order response: %s", order_result)
+
+            kind, info = _parse_order_status(order_result) or (None, None)
+            if kind in ('filled', 'resting'):
+                self._mark_account_known_good()
+            if kind == 'filled':
+                sz, px, oid = _get_fill(info)
+                logger.info("Successfully closed position for %s.", symbol)
+                logger.info("Close details - Size: %s, Price: %s, Order ID: %s", sz, px, oid)
+                
+                # Log the exit trade if we have entry information
+                if entry_price is not None and entry_time is not None:
+                    now = datetime.now(timezone.utc)
+                    size, price = float(sz), float(px)
+                    self.trade_logger.log_exit_trade(
+                        symbol=symbol,
+                        size=size,
+                        price=price,
+                        entry_price=entry_price,
+                        hold_time=int((now - entry_time).total_seconds() / 60),
+                        order_id=str(oid),
+                        # Closing a short (buying back) profits when price fell
+                        pnl=(entry_price - price if is_buy else price - entry_price) * size
+                    )
                 
-                status = order_result['response']['data']['statuses'][0]
-                if 'filled' in status:
-                    filled_info = status['filled']
-                    logger.info(f"Successfully closed position for {symbol}.")
-                    logger.info(f"Close details - Size: {filled_info['totalSz']}, Price: {filled_info['avgPx']}, Order ID: {filled_info['oid']}")
-                    
-                    # Log the exit trade if we have entry information
-                    if entry_price is not None and entry_time is not None:
-                        hold_time = int((datetime.now(timezone.utc) - entry_time).total_seconds() / 60)
-                        self.trade_logger.log_exit_trade(
-                            symbol=symbol,
-                            size=float(filled_info['totalSz']),
-                            price=float(filled_info['avgPx']),
-                            entry_price=entry_price,
-                            hold_time=hold_time,
-                            order_id=str(filled_info['oid'])
-                        )
-                    
-                    return True
-                elif 'resting' in status:
-                    logger.info(f"Close order is resting (not yet filled) for {symbol}.")
-                    return True
-
-            logger.warning(f"Position for {symbol} may not have been closed successfully. Response: {order_result}")
+                return True
+            elif kind == 'resting':
+                logger.info("Close order is resting (not yet filled) for %s.", symbol)
+                return True
+
+            logger.warning("Position for %s may not have been closed successfully. Response: %s", symbol, order_result)
             return False
 
         except Exception as e:
-            logger.error(f"Error closing position for {symbol}: {e}", exc_info=True)
+            logger.error("Error closing position for %s: %s", symbol, e, exc_info=True)
             return False
 
     def close_all_positions(self) -> list:
         """Close all open positions
         
+        Positions are fetched once and all closes are sent in a single
+        bulk_orders request: reduce-only IOC orders on the opposite side of
+        each position, priced 1% through the mid, which is what market_open
+        does per order. Coins without a mid price are skipped and reported
+        as not closed.
+
         Returns:
             list: List of close order results
         """
         try:
             positions = self.get_positions()
+            by_coin = _positions_by_coin(positions)
+            if not by_coin:
+                return []
+
+            mids = self.exchange.info.all_mids()
+            coins = []
+            order_requests = []
             results = []
-            
-            for position in positions.get('assetPositions', []):
-                coin = position['position']['coin']
-                result = self.close_position(symbol=coin)
+            for coin, pos in by_coin.items():
+                try:
+                    szi = float(pos['position']['szi'])
+                    is_buy = szi < 0  # Buy back a short, sell a long
+                    slippage = 1.01 if is_buy else 0.99  # Allow 1% slippage
+                    limit_px = self._round_price(coin, float(mids[coin]) * slippage)
+                except Exception as e:
+                    logger.warning("Skipping close for %s: no usable mid price (%s)", coin, e)
+                    results.append({'coin': coin, 'result': False})
+                    continue
+                coins.append(coin)
+                order_requests.append({
+                    "coin": coin,
+                    "is_buy": is_buy,
+                    "sz": abs(szi),
+                    "limit_px": limit_px,
+                    "order_type": {"limit": {"tif": "Ioc"}},
+                    "reduce_only": True,
+                })
+            if not order_requests:
+                return results
+
+            logger.info("Closing %d positions: %s", len(coins), coins)
+            bulk_result = self.exchange.bulk_orders(order_requests)
+            logger.info("Close all positions response: %s", bulk_result)
+
+            for i, coin in enumerate(coins):
+                kind, info = _parse_order_status(bulk_result, i) or (None, None)
+                if kind == 'filled':
+                    logger.info("Successfully closed position for %s.", coin)
+                elif kind == 'resting':
+                    logger.info("Close order is resting (not yet filled) for %s.", coin)
+                else:
+                    logger.warning("Position for %s may not have been closed successfully.", coin)
                 results.append({
                     'coin': coin,
-                    'result': result
+                    'result': kind in ('filled', 'resting')
                 })
-            
+
+            if any(r['result'] for r in results):
+                self._mark_account_known_good()
             return results
         except Exception as e:
-            logger.error(f"Error closing all positions: {e}", exc_info=True)
+            logger.error("Error closing all positions: %s", e, exc_info=True)
             return []
 
 
@@ -8,25 +8,61 @@ Use limit_chase_usage.py or your own script to run it.
 import asyncio
 import math
 import json
+import logging
+import threading
 import time
 import websockets
 from dataclasses import dataclass
-from typing import Optional
+from queue import SimpleQueue
+from typing import Any, Callable, Optional
 
 from .executor import HyperliquidExecutor
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional: C-accelerated decoding of book updates
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Constant outbound frames, encoded once. Kept as str (text frames): orjson.dumps
+# returns bytes, which websockets would send as a binary frame.
+_PING_FRAME = json.dumps({"method": "ping"})
+# Hyperliquid closes connections that send nothing for 60s; ping just inside that.
+_APP_PING_INTERVAL_S = 50
+
+
+def _now_ms() -> int:
+    """Monotonic clock in integer milliseconds (only meaningful as a delta)."""
+    return time.monotonic_ns() // 1_000_000
+
 
 def get_ws_uri(testnet: bool) -> str:
     """Return the Hyperliquid WebSocket URI for the given network."""
     return "wss://api.hyperliquid-testnet.xyz/ws" if testnet else "wss://api.hyperliquid.xyz/ws"
 
 
+def _connect(ws_uri: str, ping_interval: int):
+    """Open a Hyperliquid WebSocket (use as `async with _connect(...) as ws`)."""
+    # Frames are small and frequent; inflating each one costs more than the
+    # bandwidth it saves, so permessage-deflate is not negotiated.
+    return websockets.connect(ws_uri, ping_interval=ping_interval, compression=None, max_size=2**20)
+
+
+async def _app_keepalive(ws) -> None:
+    """Send Hyperliquid's app-level ping so a subscribe-only client isn't dropped as idle."""
+    while True:
+        await asyncio.sleep(_APP_PING_INTERVAL_S)
+        await ws.send(_PING_FRAME)
+
+
 # ---------- Data Types ----------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Quote:
-    """Represents a price quote from the order book."""
+    """Represents a price quote from the order book. ts_ms is from a monotonic clock."""
     ts_ms: int
     bid_px: float
     bid_sz: float
@@ -34,12 +70,105 @@ class Quote:
     ask_sz: float
 
 
+class QuoteSlot:
+    """
+    Single-slot, latest-wins quote holder.
+
+    Can be passed to stream_l2_to_queue in place of an asyncio.Queue: put()
+    overwrites any quote the consumer has not taken yet, so get() always
+    returns the freshest quote and memory stays constant under bursty books.
+
+    With min_interval_ms set, get() returns at most one quote per interval.
+    Quotes arriving in between are not dropped: the latest one is returned
+    once the interval has passed.
+    """
+
+    def __init__(self, min_interval_ms: int = 0) -> None:
+        self._quote: Optional[Quote] = None
+        self._event = asyncio.Event()
+        self._min_interval_ms = min_interval_ms
+        self._last_get_ms = -min_interval_ms
+
+    def put_nowait(self, q: Quote) -> None:
+        self._quote = q
+        self._event.set()
+
+    async def put(self, q: Quote) -> None:
+        self.put_nowait(q)
+
+    async def get(self) -> Quote:
+        """Wait for a quote newer than the last one returned."""
+        await self._event.wait()
+        if self._min_interval_ms:
+            wait_ms = self._last_get_ms + self._min_interval_ms - _now_ms()
+            if wait_ms > 0:
+                await asyncio.sleep(wait_ms / 1000)
+            self._last_get_ms = _now_ms()
+        # Cleared after any throttle sleep, so quotes put meanwhile are folded in
+        self._event.clear()
+        return self._quote
+
+
+def _resolve_threadsafe(
+    loop: asyncio.AbstractEventLoop, fut: asyncio.Future, setter: Callable[[Any], None], value: Any
+) -> None:
+    """Complete `fut` from another thread, unless it was cancelled or the loop closed."""
+
+    def _set() -> None:
+        if not fut.done():
+            setter(value)
+
+    try:
+        loop.call_soon_threadsafe(_set)
+    except RuntimeError:  # event loop already closed
+        pass
+
+
 class LiveExchangeClient:
     """Wraps the HyperliquidExecutor to interact with the real exchange."""
 
     def __init__(self, executor: HyperliquidExecutor, coin: str):
         self.executor = executor
         self.coin = coin
+        # Executor calls are blocking HTTP; run them on one dedicated thread
+        # rather than dispatching each through the default thread pool.
+        self._jobs: SimpleQueue = SimpleQueue()
+        self._worker = threading.Thread(
+            target=self._run_jobs, name=f"LiveExchangeClient-{coin}", daemon=True
+        )
+        self._worker.start()
+        # Fill tracking pushed by stream_order_updates. Orders placed while the
+        # stream is subscribed are tracked; poll_fill answers those from
+        # _filled_ids and falls back to HTTP for everything else. Only fills
+        # for self.coin are kept, and each is dropped once poll_fill reports it.
+        self._filled_ids: set[str] = set()
+        self._tracked_ids: set[str] = set()
+        self._fills_live = False
+        self._fills_epoch = 0  # bumped on every disconnect
+
+    def _run_jobs(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            fn, args, kwargs, fut, loop = job
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                _resolve_threadsafe(loop, fut, fut.set_exception, e)
+            else:
+                _resolve_threadsafe(loop, fut, fut.set_result, result)
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run fn(*args, **kwargs) on the worker thread and await its result."""
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._jobs.put((fn, args, kwargs, fut, loop))
+        return await fut
+
+    def close(self) -> None:
+        """Stop the worker thread once queued calls have run."""
+        self._jobs.put(None)
 
     async def place_limit(
         self,
@@ -63,38 +192,94 @@ class LiveExchangeClient:
             Order ID as string, or None if placement failed
         """
         is_buy = side == "buy"
-        order_id = await asyncio.to_thread(
+        live, epoch = self._fills_live, self._fills_epoch
+        order_id = await self._submit(
             self.executor.execute_limit_order,
             symbol=self.coin,
             is_buy=is_buy,
             size_in_asset=size,
             limit_price=price,
         )
-        return str(order_id) if order_id is not None else None
+        if order_id is None:
+            return None
+        order_id = str(order_id)
+        if live and epoch == self._fills_epoch:
+            self._tracked_ids.add(order_id)
+        return order_id
 
     async def cancel(self, order_id: str) -> None:
         """Cancel an order by its ID."""
-        await asyncio.to_thread(self.executor.cancel_order, self.coin, int(order_id))
+        await self._submit(self.executor.cancel_order, self.coin, int(order_id))
 
     async def poll_fill(self, order_id: str) -> bool:
         """
         Check if an order has been filled.
 
+        Answered without I/O when stream_order_updates has been subscribed
+        since before the order was placed; otherwise queries the exchange.
+
         Args:
             order_id: The order ID to check
 
         Returns:
             True if filled, False otherwise
         """
-        order_status = await asyncio.to_thread(
-            self.executor.get_order_status, int(order_id)
-        )
+        if order_id in self._filled_ids:
+            self._filled_ids.discard(order_id)
+            self._tracked_ids.discard(order_id)
+            return True
+        if self._fills_live and order_id in self._tracked_ids:
+            return False
+        order_status = await self._submit(self.executor.get_order_status, int(order_id))
         if order_status is None:
             return False
         status = order_status.get("status") or (order_status.get("order") or {}).get(
             "status"
         )
-        return status == "filled"
+        if status == "filled":
+            self._filled_ids.discard(order_id)
+            self._tracked_ids.discard(order_id)
+            return True
+        return False
+
+    async def stream_order_updates(self, ws_uri: str, *, ping_interval: int = 20) -> None:
+        """
+        Track fills of this account's orders from the `orderUpdates` channel.
+
+        Run as a background task alongside the chaser. While subscribed,
+        poll_fill needs no HTTP request for orders placed through this client.
+        On disconnect every order falls back to HTTP polling, since fills
+        may have been missed.
+
+        Args:
+            ws_uri: WebSocket URI (e.g. from get_ws_uri(testnet))
+            ping_interval: Seconds between WebSocket protocol pings (connection health)
+        """
+        sub_frame = json.dumps(
+            {"method": "subscribe", "subscription": {"type": "orderUpdates", "user": self.executor.address}}
+        )
+        async with _connect(ws_uri, ping_interval) as ws:
+            await ws.send(sub_frame)
+            ka = asyncio.create_task(_app_keepalive(ws))
+            filled_ids, coin = self._filled_ids, self.coin
+            try:
+                async for raw in ws:
+                    msg = _json_loads(raw)
+                    channel = msg.get("channel")
+                    if channel == "orderUpdates":
+                        for update in msg.get("data") or ():
+                            order = update.get("order") or {}
+                            if update.get("status") == "filled" and order.get("coin") == coin:
+                                filled_ids.add(str(order["oid"]))
+                    elif channel == "subscriptionResponse" and not self._fills_live:
+                        self._fills_live = True
+                        logger.info("Subscribed to orderUpdates for %s", self.executor.address)
+            finally:
+                ka.cancel()
+                self._fills_live = False
+                self._fills_epoch += 1
+                self._tracked_ids.clear()
+                self._filled_ids.clear()
 
 
 class LimitChaser:
@@ -122,82 +307,125 @@ class LimitChaser:
         self.tolerance_ticks = tolerance_ticks
         self.max_age_ms = max_age_ms
         self.max_chase_ticks = max_chase_ticks
+        self._inv_tick = 1.0 / tick_size
         self.order_id = None
         self.order_px = None
         self.start_px = None
+        self.order_px_ticks = None
+        self.start_px_ticks = None
         self.placed_ts = None
+        self._fill_task: Optional[asyncio.Task] = None
 
-    def _round_to_tick(self, px: float) -> float:
-        return math.floor(px / self.tick_size) * self.tick_size
+    def _start_fill_poll(self) -> None:
+        """Poll the current order's fill status in the background."""
+        self._fill_task = (
+            asyncio.create_task(self.ex.poll_fill(self.order_id)) if self.order_id else None
+        )
+
+    def _stop_fill_poll(self) -> None:
+        if self._fill_task is not None and not self._fill_task.done():
+            self._fill_task.cancel()
+        self._fill_task = None
+
+    async def _await_fill_poll(self) -> bool:
+        """Wait for the in-flight fill poll (if any) and return whether the order filled."""
+        task = self._fill_task
+        self._fill_task = None
+        return bool(task is not None and await task)
+
+    def _on_filled(self) -> str:
+        logger.info("[filled] order_id=%s at ~$%.2f", self.order_id, self.order_px)
+        self._reset()
+        return "filled"
+
+    def _to_ticks(self, px: float) -> int:
+        """Price as a whole number of ticks, rounded down (small epsilon absorbs FP error)."""
+        return math.floor(px * self._inv_tick + 1e-9)
 
     async def on_quote(self, q: Quote) -> Optional[str]:
         """
         Process a quote and optionally place, chase, or cancel.
 
+        Order age is measured as a delta of q.ts_ms, which must come from a
+        monotonic millisecond clock (as produced by stream_l2_to_queue).
+
+        Fill status is polled in a background task, so quotes that need no
+        action never wait on the exchange. Before cancelling to refresh or
+        abort, the pending poll is awaited so a filled order is not replaced.
+
         Returns:
             "filled" when the order filled, "aborted" when chase was given up, None otherwise.
         """
         now = q.ts_ms
-        target_px = q.bid_px if self.side == "buy" else q.ask_px
-        target_px = self._round_to_tick(target_px)
+        target_ticks = self._to_ticks(q.bid_px if self.side == "buy" else q.ask_px)
+        target_px = target_ticks * self.tick_size
 
         if self.order_id is None:
             self.start_px = target_px
             self.order_px = target_px
+            self.start_px_ticks = target_ticks
+            self.order_px_ticks = target_ticks
             self.order_id = await self.ex.place_limit(
                 self.side, target_px, self.order_size, post_only=self.post_only, tif="GTC"
             )
             self.placed_ts = now
             if self.order_id:
-                print(
-                    f"[placed] {self.side} {self.order_size}@{target_px} -> order_id={self.order_id}"
+                logger.info(
+                    "[placed] %s %s@%s -> order_id=%s", self.side, self.order_size, target_px, self.order_id
                 )
+                self._start_fill_poll()
             return None
 
-        filled = await self.ex.poll_fill(self.order_id)
-        if filled:
-            print(f"[filled] order_id={self.order_id} at ~${self.order_px:.2f}")
-            self._reset()
-            return "filled"
+        if self._fill_task is None:
+            self._start_fill_poll()
+        elif self._fill_task.done():
+            if self._fill_task.result():
+                self._fill_task = None
+                return self._on_filled()
+            self._start_fill_poll()
 
-        drift_ticks = abs(target_px - self.order_px) / self.tick_size
+        drift_ticks = abs(target_ticks - self.order_px_ticks)
         age_ms = now - self.placed_ts
-        total_chase_ticks = abs(target_px - self.start_px) / self.tick_size
+        total_chase_ticks = abs(target_ticks - self.start_px_ticks)
 
         should_refresh = (drift_ticks >= self.tolerance_ticks) or (
             age_ms >= self.max_age_ms
         )
         should_abort = total_chase_ticks > self.max_chase_ticks
 
+        if (should_abort or should_refresh) and await self._await_fill_poll():
+            return self._on_filled()
+
         if should_abort:
-            print(
-                f"[abort] price moved {total_chase_ticks:.1f} ticks from start; giving up."
-            )
+            logger.info("[abort] price moved %.1f ticks from start; giving up.", total_chase_ticks)
             await self.ex.cancel(self.order_id)
             self._reset()
             return "aborted"
 
         if should_refresh:
             if drift_ticks >= self.tolerance_ticks:
-                print(
-                    f"[refresh] price drifted {drift_ticks:.1f} ticks, chasing to ${target_px:.2f}"
-                )
+                logger.info("[refresh] price drifted %.1f ticks, chasing to $%.2f", drift_ticks, target_px)
             elif age_ms >= self.max_age_ms:
-                print(f"[refresh] order stale ({age_ms}ms), refreshing")
+                logger.info("[refresh] order stale (%sms), refreshing", age_ms)
 
             await self.ex.cancel(self.order_id)
             self.order_id = await self.ex.place_limit(
                 self.side, target_px, self.order_size, post_only=self.post_only, tif="GTC"
             )
             self.order_px = target_px
+            self.order_px_ticks = target_ticks
             self.placed_ts = now
+            self._start_fill_poll()
 
         return None
 
     def _reset(self) -> None:
+        self._stop_fill_poll()
         self.order_id = None
         self.order_px = None
         self.start_px = None
+        self.order_px_ticks = None
+        self.start_px_ticks = None
         self.placed_ts = None
 
 
@@ -205,52 +433,107 @@ class LimitChaser:
 
 
 async def stream_l2_to_queue(
-    queue: asyncio.Queue, coin: str, ws_uri: str, *, ping_interval: int = 20
+    queue: asyncio.Queue | QuoteSlot,
+    coin: str,
+    ws_uri: str,
+    *,
+    ping_interval: int = 20,
+    l2_book: bool = False,
+    max_idle_ms: int = 1000,
 ) -> None:
     """
-    Stream L2 order book from Hyperliquid WebSocket into a queue.
+    Stream top of book from Hyperliquid WebSocket into a queue.
+
+    By default subscribes to the `bbo` channel, which only carries the best
+    bid/offer. Set l2_book=True to subscribe to the full `l2Book` instead.
+    Updates that leave both best bid and best ask prices unchanged are dropped.
+    Every other update is emitted; to rate-limit the consumer, pass a QuoteSlot
+    with min_interval_ms, which keeps the latest quote instead of dropping it.
+    When prices have not changed for max_idle_ms, the last quote is re-emitted
+    with a fresh timestamp, so consumers still run their order-age and fill
+    checks on a steady book.
 
     Args:
-        queue: Queue to put Quote objects into
+        queue: Queue (or QuoteSlot) to put Quote objects into
         coin: Coin symbol (e.g. "BTC")
         ws_uri: WebSocket URI (e.g. from get_ws_uri(testnet))
-        ping_interval: Seconds between pings
+        ping_interval: Seconds between WebSocket protocol pings (connection health)
+        l2_book: Subscribe to the full L2 book rather than best bid/offer
+        max_idle_ms: Re-emit the last quote after this long without a price change (0 = never)
     """
-    async with websockets.connect(ws_uri, ping_interval=ping_interval) as ws:
-        await ws.send(
-            json.dumps({"method": "subscribe", "subscription": {"type": "l2Book", "coin": coin}})
-        )
-        print(f"Subscribed to L2 book for {coin}")
-
-        async def keepalive() -> None:
+    channel = "l2Book" if l2_book else "bbo"
+    sub_frame = json.dumps({"method": "subscribe", "subscription": {"type": channel, "coin": coin}})
+    async with _connect(ws_uri, ping_interval) as ws:
+        await ws.send(sub_frame)
+        logger.info("Subscribed to %s for %s", channel, coin)
+        last_quote: Optional[Quote] = None
+        last_emit_ms = _now_ms()
+
+        async def heartbeat() -> None:
+            nonlocal last_emit_ms
             while True:
-                await ws.send(json.dumps({"method": "ping"}))
-                await asyncio.sleep(ping_interval)
-
-        ka = asyncio.create_task(keepalive())
+                idle_ms = _now_ms() - last_emit_ms
+                if idle_ms < max_idle_ms:
+                    await asyncio.sleep((max_idle_ms - idle_ms) / 1000)
+                    continue
+                last_emit_ms = _now_ms()
+                if last_quote is not None:
+                    q = last_quote
+                    await queue.put(Quote(last_emit_ms, q.bid_px, q.bid_sz, q.ask_px, q.ask_sz))
+
+        ka = asyncio.create_task(_app_keepalive(ws))
+        hb = asyncio.create_task(heartbeat()) if max_idle_ms > 0 else None
+        # Price strings of the last emitted quote and their parsed floats
+        last_bid_str = last_ask_str = None
+        bid_px = ask_px = 0.0
+        msg_count = 0
+        # Hot-loop names bound as locals
+        loads, now, put = _json_loads, _now_ms, queue.put
         try:
             async for raw in ws:
-                msg = json.loads(raw)
-                if msg.get("channel") != "l2Book":
-                    continue
-                book = msg.get("data", {})
-                levels = book.get("levels", [])
-                if not (isinstance(levels, list) and len(levels) >= 2):
+                # Buffered frames are consumed without suspending; yield every
+                # 64 messages so the consumer and fill polls get scheduled.
+                msg_count += 1
+                if msg_count & 63 == 0:
+                    await asyncio.sleep(0)
+                msg = loads(raw)
+                if msg.get("channel") != channel:
                     continue
-                bids = levels[0] or []
-                asks = levels[1] or []
-                if not (bids and asks):
+                data = msg.get("data")
+                if not data:
                     continue
-                b0, a0 = bids[0], asks[0]
-                bid_px, bid_sz = float(b0["px"]), float(b0["sz"])
-                ask_px, ask_sz = float(a0["px"]), float(a0["sz"])
-                q = Quote(
-                    ts_ms=int(time.time() * 1000),
-                    bid_px=bid_px,
-                    bid_sz=bid_sz,
-                    ask_px=ask_px,
-                    ask_sz=ask_sz,
-                )
-                await queue.put(q)
+                if l2_book:
+                    levels = data.get("levels")
+                    if not (isinstance(levels, list) and len(levels) >= 2):
+                        continue
+                    bids, asks = levels[0], levels[1]
+                    if not (bids and asks):
+                        continue
+                    b0, a0 = bids[0], asks[0]
+                else:
+                    bbo = data.get("bbo")
+                    if not bbo:
+                        continue
+                    b0, a0 = bbo[0], bbo[1]
+                    if not (b0 and a0):  # a side is null when that book side is empty
+                        continue
+                bid_str, ask_str = b0["px"], a0["px"]
+                if bid_str == last_bid_str and ask_str == last_ask_str:
+                    continue  # size-only update
+                # Only re-parse the side whose price changed
+                if bid_str != last_bid_str:
+                    bid_px = float(bid_str)
+                    last_bid_str = bid_str
+                if ask_str != last_ask_str:
+                    ask_px = float(ask_str)
+                    last_ask_str = ask_str
+                bid_sz, ask_sz = float(b0["sz"]), float(a0["sz"])
+                last_emit_ms = now()
+                # A fresh immutable Quote per emit: consumers may hold on to it
+                # across awaits, so a reused mutable instance would be unsafe.
+                last_quote = Quote(last_emit_ms, bid_px, bid_sz, ask_px, ask_sz)
+                await put(last_quote)
         finally:
             ka.cancel()
+            if hb is not None:
+                hb.cancel()
@@ -1,18 +1,205 @@
+"""
+Trade logging for the executor.
+
+Trades are queued in memory and written by a background thread in batches,
+so logging never blocks the order path. Rows are always echoed to the console;
+when a DATABASE_URL is given (and psycopg2 is installed) they are also inserted
+into a `trade_log` table:
+
+    CREATE TABLE trade_log (
+        logged_at   TIMESTAMPTZ NOT NULL,
+        kind        TEXT NOT NULL,          -- 'entry' or 'exit'
+        symbol      TEXT NOT NULL,
+        size        DOUBLE PRECISION,
+        price       DOUBLE PRECISION,
+        entry_price DOUBLE PRECISION,
+        pnl         DOUBLE PRECISION,
+        zscore      DOUBLE PRECISION,
+        trend       TEXT,
+        hold_time   INTEGER,
+        order_id    TEXT
+    );
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+try:
+    import psycopg2
+    from psycopg2.extras import execute_values
+except ImportError:  # Optional: only needed when writing to a database
+    psycopg2 = None
+
+try:
+    import numpy as np
+except ImportError:  # Optional: only speeds up log_exit_trades_bulk
+    np = None
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = (
+    "logged_at", "kind", "symbol", "size", "price", "entry_price",
+    "pnl", "zscore", "trend", "hold_time", "order_id",
+)
+_INSERT_SQL = f"INSERT INTO trade_log ({', '.join(_COLUMNS)}) VALUES %s"
 
 
 class TradeLogger:
+    __slots__ = ('_db_url', '_conn', '_pending', '_write_lock', '_wakeup', '_closed', '_thread')
+
+    BATCH_SIZE = 64
+    FLUSH_INTERVAL_S = 0.5
+    MAX_PENDING = 10_000  # oldest rows are dropped beyond this
+
     def __init__(self, db_url: str):
-        print(f"TradeLogger initialized with db_url: {db_url}")
-        # In a real implementation, you would connect to the database here.
-        pass
+        if db_url and psycopg2 is None:
+            logger.warning("DATABASE_URL set but psycopg2 is not installed; trades will only be printed.")
+        self._db_url = db_url if psycopg2 is not None else ""
+        # Never log the URL itself: it carries the database password
+        logger.info("TradeLogger initialized (%s)", "writing to database" if self._db_url else "console only")
+        self._conn = None
+        self._pending = deque(maxlen=self.MAX_PENDING)
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._flush_loop, name="TradeLogger", daemon=True)
+        self._thread.start()
+        # The writer is a daemon thread; make sure queued rows survive interpreter exit
+        atexit.register(self.close)
 
     def log_entry_trade(self, symbol: str, size: float, price: float, zscore: float, trend: str, order_id: str):
-        print(f"[TRADE_LOG] Entry: {symbol}, Size: {size}, Price: {price}, Z-Score: {zscore}, Trend: {trend}, OrderID: {order_id}")
-        # In a real implementation, you would write this to the database.
-        pass
-
-    def log_exit_trade(self, symbol: str, size: float, price: float, entry_price: float, hold_time: int, order_id: str):
-        pnl = (price - entry_price) * size
-        print(f"[TRADE_LOG] Exit: {symbol}, Size: {size}, Price: {price}, PnL: {pnl}, Hold Time: {hold_time}m, OrderID: {order_id}")
-        # In a real implementation, you would write this to the database.
-        pass
+        self._enqueue({
+            "logged_at": time.time(), "kind": "entry", "symbol": symbol, "size": size,
+            "price": price, "entry_price": None, "pnl": None, "zscore": zscore,
+            "trend": trend, "hold_time": None, "order_id": order_id,
+        })
+
+    def log_exit_trade(self, symbol: str, size: float, price: float, entry_price: float, hold_time: int, order_id: str,
+                       pnl: float | None = None):
+        # Without an explicit pnl, the trade is assumed to close a long position
+        if pnl is None:
+            pnl = (price - entry_price) * size
+        self._enqueue({
+            "logged_at": time.time(), "kind": "exit", "symbol": symbol, "size": size,
+            "price": price, "entry_price": entry_price, "pnl": pnl, "zscore": None,
+            "trend": None, "hold_time": hold_time, "order_id": order_id,
+        })
+
+    def log_exit_trades_bulk(self, symbols, sizes, prices, entry_prices, hold_times, order_ids,
+                             echo: bool = True) -> None:
+        """
+        Log many exit trades at once (e.g. backtest replays). PnL assumes each
+        trade closes a long position.
+
+        PnL is computed for the whole batch in one vectorized step when numpy is
+        installed, and the rows are written immediately as a single batch instead
+        of going through the queue. Pass echo=False to skip the per-row console
+        line, which dominates the cost for large replays.
+
+        Raises:
+            ValueError: If the input sequences differ in length.
+        """
+        n = len(symbols)
+        if any(len(col) != n for col in (sizes, prices, entry_prices, hold_times, order_ids)):
+            raise ValueError("log_exit_trades_bulk: all input sequences must have the same length")
+        if not n or not (echo or self._db_url):
+            return
+        if np is not None:
+            sizes = np.asarray(sizes, dtype=float)
+            prices = np.asarray(prices, dtype=float)
+            entry_prices = np.asarray(entry_prices, dtype=float)
+            pnls = ((prices - entry_prices) * sizes).tolist()
+            sizes, prices, entry_prices = sizes.tolist(), prices.tolist(), entry_prices.tolist()
+        else:
+            pnls = [(price - entry_price) * size for size, price, entry_price in zip(sizes, prices, entry_prices)]
+        logged_at = datetime.fromtimestamp(time.time(), timezone.utc)
+        # Rows in _COLUMNS order, ready for execute_values
+        values = [
+            (logged_at, "exit", symbol, size, price, entry_price, pnl, None, None, int(hold_time), str(order_id))
+            for symbol, size, price, entry_price, pnl, hold_time, order_id
+            in zip(symbols, sizes, prices, entry_prices, pnls, hold_times, order_ids)
+        ]
+        if echo:
+            for _, _, symbol, size, price, _, pnl, _, _, hold_time, order_id in values:
+                print(f"[TRADE_LOG] Exit: {symbol}, Size: {size}, Price: {price}, "
+                      f"PnL: {pnl}, Hold Time: {hold_time}m, OrderID: {order_id}")
+        if self._db_url:
+            with self._write_lock:
+                self._insert(values)
+
+    def flush(self) -> None:
+        """Write all queued trades now, from the calling thread."""
+        self._drain()
+
+    def close(self) -> None:
+        """
+        Flush remaining trades, stop the writer thread and close the DB connection.
+
+        Safe to call more than once; trades logged afterwards are written synchronously.
+        """
+        atexit.unregister(self.close)
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout=5)
+        self._drain()
+        with self._write_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _enqueue(self, row: dict) -> None:
+        if self._closed:  # no writer thread left to drain the queue
+            with self._write_lock:
+                self._write_batch([row])
+            return
+        self._pending.append(row)
+        if self._closed:  # close() drained before this row landed
+            self._drain()
+        elif len(self._pending) >= self.BATCH_SIZE:
+            self._wakeup.set()
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.FLUSH_INTERVAL_S)
+            self._wakeup.clear()
+            self._drain()
+
+    def _drain(self) -> None:
+        with self._write_lock:
+            while self._pending:
+                batch = []
+                while self._pending and len(batch) < self.BATCH_SIZE:
+                    batch.append(self._pending.popleft())
+                self._write_batch(batch)
+
+    def _write_batch(self, batch: list) -> None:
+        for row in batch:
+            if row["kind"] == "entry":
+                print(f"[TRADE_LOG] Entry: {row['symbol']}, Size: {row['size']}, Price: {row['price']}, "
+                      f"Z-Score: {row['zscore']}, Trend: {row['trend']}, OrderID: {row['order_id']}")
+            else:
+                print(f"[TRADE_LOG] Exit: {row['symbol']}, Size: {row['size']}, Price: {row['price']}, "
+                      f"PnL: {row['pnl']}, Hold Time: {row['hold_time']}m, OrderID: {row['order_id']}")
+
+        if self._db_url:
+            self._insert([
+                (datetime.fromtimestamp(row["logged_at"], timezone.utc),) + tuple(row[c] for c in _COLUMNS[1:])
+                for row in batch
+            ])
+
+    def _insert(self, values: list) -> None:
+        """Insert rows (tuples in _COLUMNS order); caller holds _write_lock."""
+        try:
+            if self._conn is None:
+                self._conn = psycopg2.connect(self._db_url)
+            with self._conn, self._conn.cursor() as cur:
+                execute_values(cur, _INSERT_SQL, values)
+        except Exception as e:
+            logger.error("Failed to write %d trade log rows: %s", len(values), e)
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None